@@ -19,6 +19,7 @@ MySQL 자동 테스트 데이터 생성 프로그램 (TUI)
 """
 
 import os
+import re
 import sys
 import json
 import time
@@ -26,14 +27,22 @@ import random
 import string
 import subprocess
 import signal
-import glob
+import tempfile
+import queue
+import threading
+import functools
+import unicodedata
+from collections import Counter, deque
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, wait as futures_wait
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Any, Optional, Tuple
 
 # MySQL 연결 라이브러리
 try:
     import mysql.connector
+    import mysql.connector.pooling
 except ImportError:
     print("mysql-connector-python 라이브러리를 설치하세요: pip install mysql-connector-python")
     sys.exit(1)
@@ -55,6 +64,12 @@ WORK_DIR = "work"  # 각 실행(run)마다 삽입된 PK 정보를 JSON으로 저
 DUMP_DIR = "dump"  # MySQL 덤프 파일 저장
 CONFIG_DIR = "config"
 SCENARIO_DIR = "scenario"
+INSERT_BATCH_SIZE = 1000  # multi-row INSERT 한 문장에 묶는 최대 레코드 수
+MAX_PREPARED_PLACEHOLDERS = 65535  # prepared statement 한 문장의 최대 파라미터 수
+ROLLBACK_BATCH_SIZE = 10000  # 롤백 DELETE ... IN (...) 한 문장에 묶는 최대 PK 수
+LOAD_INFILE_THRESHOLD = 100000  # 이 레코드 수 이상인 테이블은 LOAD DATA LOCAL INFILE로 적재
+PROGRESS_REFRESH_INTERVAL_NS = 33_000_000  # 진행 상태 화면 갱신 최소 간격 (약 30Hz)
+RUN_LOG_FORMAT_VERSION = 2  # run 로그 형식 (1: inserted_rows PK 목록, 2: inserted_rows + inserted_rows_ranges 구간)
 
 
 # ==========================
@@ -82,14 +97,59 @@ def release_lock():
         pass
 
 
+# 랜덤 바이트(0~255)를 영문/숫자 62자로 매핑하는 변환 테이블
+_ALPHABET = (string.ascii_letters + string.digits).encode("ascii")
+_ALPHABET_TABLE = bytes(_ALPHABET[b % len(_ALPHABET)] for b in range(256))
+# 256은 62의 배수가 아니라 % 62만 하면 앞쪽 문자(a~h)가 더 자주 나옴
+# → 248(62의 배수) 이상인 바이트는 버려서(rejection sampling) 모든 문자를 같은 확률로 뽑음
+_ALPHABET_REJECT = bytes(range(256 - 256 % len(_ALPHABET), 256))
+
+
+def _random_alphabet_chars(n: int) -> str:
+    """알파벳 문자 n개를 균등 분포로 생성 (버려진 바이트만큼 더 뽑아서 채움)"""
+    chars = b""
+    while len(chars) < n:
+        need = n - len(chars)
+        # 버려지는 비율은 8/256이므로 조금 넉넉히 뽑아 대부분 한 번에 끝나게 함
+        chars += random.randbytes(need + need // 16 + 8).translate(_ALPHABET_TABLE, _ALPHABET_REJECT)
+    return chars[:n].decode("ascii")
+
+
 def random_string(length: int = 8) -> str:
-    return "".join(random.choices(string.ascii_letters + string.digits, k=length))
+    return _random_alphabet_chars(length)
+
+
+def random_strings(length: int, count: int) -> List[str]:
+    """길이 length인 랜덤 문자열 count개 (바이트를 한 번에 뽑아 변환 후 잘라서 생성)"""
+    chars = _random_alphabet_chars(length * count)
+    return [chars[i:i + length] for i in range(0, length * count, length)]
 
 
 def random_int(min_val: int = 1, max_val: int = 10000) -> int:
     return random.randint(min_val, max_val)
 
 
+def random_ints(count: int, min_val: int = 1, max_val: int = 10000) -> List[int]:
+    """[min_val, max_val] 범위 랜덤 정수 count개"""
+    return random.choices(range(min_val, max_val + 1), k=count)
+
+
+def compress_id_ranges(ids: List[Any]) -> List[List[Any]]:
+    """
+    PK 목록을 [[start, count], ...] 구간으로 압축
+    - 1씩 증가하는 정수 PK는 하나의 구간으로 묶음
+    - 정수가 아니거나 연속되지 않는 PK는 count=1 구간
+    """
+    ranges: List[List[Any]] = []
+    for pk in ids:
+        if ranges and isinstance(pk, int) and isinstance(ranges[-1][0], int) \
+                and ranges[-1][0] + ranges[-1][1] == pk:
+            ranges[-1][1] += 1
+        else:
+            ranges.append([pk, 1])
+    return ranges
+
+
 def ensure_work_dir(profile: str, scenario: str):
     """work/{profile}_{scenario}/ 디렉토리 생성"""
     work_path = os.path.join(WORK_DIR, f"{profile}_{scenario}")
@@ -110,14 +170,15 @@ def get_available_profiles() -> List[str]:
     if not os.path.exists(CONFIG_DIR):
         return []
     profiles = []
-    for item in os.listdir(CONFIG_DIR):
-        path = os.path.join(CONFIG_DIR, item)
-        if os.path.isdir(path):
-            # connection.json과 schema.sql이 있는지 확인
-            conn_file = os.path.join(path, "connection.json")
-            schema_file = os.path.join(path, "schema.sql")
-            if os.path.exists(conn_file) and os.path.exists(schema_file):
-                profiles.append(item)
+    with os.scandir(CONFIG_DIR) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            # connection.json과 schema.sql이 있는지 확인 (디렉토리 1회 스캔)
+            with os.scandir(entry.path) as files:
+                names = {f.name for f in files if f.is_file()}
+            if "connection.json" in names and "schema.sql" in names:
+                profiles.append(entry.name)
     return sorted(profiles)
 
 
@@ -127,10 +188,13 @@ def get_available_scenarios(profile: str) -> List[Tuple[str, str]]:
     if not os.path.exists(scenario_path):
         return []
     
-    scenarios = []
-    for file in glob.glob(os.path.join(scenario_path, "*.json")):
-        filename = os.path.basename(file)
-        scenarios.append((filename, file))
+    # *.json 파일만 (glob과 동일하게 숨김 파일 제외)
+    with os.scandir(scenario_path) as entries:
+        scenarios = [
+            (entry.name, entry.path)
+            for entry in entries
+            if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file()
+        ]
     return sorted(scenarios)
 
 
@@ -150,44 +214,96 @@ def load_connection_config(profile: str) -> Dict[str, Any]:
     return config
 
 
+# ==========================
+# 커넥션 풀
+# ==========================
+
+class ConnectionPool:
+    """
+    연결 설정별 mysql.connector 커넥션 풀
+    - 메뉴 동작마다 TCP 연결/인증을 반복하지 않도록 세션 동안 연결 재사용
+    - 꺼낸 연결의 close()는 실제 종료가 아니라 풀 반환 (세션 상태는 초기화됨)
+    """
+
+    POOL_SIZE = 4
+    _pools: Dict[str, Any] = {}
+
+    @classmethod
+    def get_connection(cls, db_config: Dict[str, Any]):
+        key = json.dumps(db_config, sort_keys=True, default=str)
+        pool = cls._pools.get(key)
+        if pool is None:
+            config = dict(db_config)
+            config["autocommit"] = False  # 모든 매니저가 트랜잭션 + 명시적 commit 사용
+            pool = mysql.connector.pooling.MySQLConnectionPool(
+                pool_name=f"provisioner_{len(cls._pools)}",
+                pool_size=cls.POOL_SIZE,
+                pool_reset_session=True,
+                **config,
+            )
+            cls._pools[key] = pool
+        return pool.get_connection()
+
+    @classmethod
+    def close_all(cls):
+        """
+        풀에 대기 중인 연결 모두 종료 (프로그램 종료 시)
+        - 꺼낸 연결의 close()는 풀 반환이라 공개 API로는 실제 종료가 불가능하므로
+          MySQLConnectionPool._remove_connections()를 사용
+          (mysql-connector-python 1.x ~ 9.x에서 큐의 연결을 disconnect()하고 개수를 반환하며,
+           연결별 종료 오류는 내부에서 무시하고 PoolError만 다시 발생시킴)
+        """
+        for pool in cls._pools.values():
+            try:
+                pool._remove_connections()
+            except mysql.connector.Error as e:
+                print(f"커넥션 풀 종료 실패 ({pool.pool_name}): {e}", file=sys.stderr)
+        cls._pools.clear()
+
+
 # ==========================
 # 데이터 구조 정의
 # ==========================
 
-@dataclass
+# 파싱 결과 객체는 많이 만들어지고 자주 읽히므로 __slots__ 사용 (Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ColumnInfo:
     name: str
     type: str
     is_primary: bool = False
     is_nullable: bool = True
     has_default: bool = False
+    is_auto_increment: bool = False
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TableInfo:
     name: str
     columns: List[ColumnInfo] = field(default_factory=list)
     primary_key: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SchemaInfo:
     tables: Dict[str, TableInfo] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ScenarioTable:
     name: str
     count: int
     relations: Dict[str, str] = field(default_factory=dict)  # column_name -> "parent_table.parent_pk"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ScenarioInfo:
     tables: Dict[str, ScenarioTable] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class RunLogEntry:
     run_id: str
     created_at: str
@@ -200,6 +316,16 @@ class RunLogEntry:
 # 스키마 파서
 # ==========================
 
+# 줄 맨 앞의 CREATE TABLE부터 ';'로 끝나는 줄까지 (';'이 없으면 다음 CREATE TABLE 또는 파일 끝까지)
+# - 줄 중간의 ';'(COMMENT 'a;b', DEFAULT ';' 등)에서는 블록을 끊지 않음
+_CREATE_TABLE_RE = re.compile(
+    r"^[ \t]*CREATE\s+TABLE\b.*?(?:;[ \t\r]*$|(?=^[ \t]*CREATE\s+TABLE\b)|\Z)",
+    re.IGNORECASE | re.MULTILINE | re.DOTALL,
+)
+# PRIMARY KEY (`id`) / `col` TYPE ... 라인 파싱용
+_PK_RE = re.compile(r"^PRIMARY\s+KEY\s*\(\s*`?([^`\s,)]+)`?", re.IGNORECASE)
+_COLUMN_RE = re.compile(r"^`([^`]+)`\s+(\S+)")
+
 class MySQLSchemaParser:
     """
     매우 단순한 CREATE TABLE 파서.
@@ -209,58 +335,45 @@ class MySQLSchemaParser:
 
     def __init__(self, schema_file: str):
         self.schema_file = schema_file
+        # 파일 내용/블록/파싱 결과는 인스턴스당 한 번만 계산
+        self._sql: Optional[str] = None
+        self._blocks: Optional[List[str]] = None
+        self._schema: Optional[SchemaInfo] = None
 
     def parse(self) -> SchemaInfo:
-        if not os.path.exists(self.schema_file):
-            raise FileNotFoundError(f"스키마 파일을 찾을 수 없습니다: {self.schema_file}")
-
-        with open(self.schema_file, "r", encoding="utf-8") as f:
-            sql = f.read()
+        if self._schema is not None:
+            return self._schema
 
-        # CREATE TABLE 블록 단위로 분리
-        blocks = self._split_create_table_blocks(sql)
         schema = SchemaInfo()
-
-        for block in blocks:
+        for block in self._get_blocks():
             table_info = self._parse_table_block(block)
             if table_info is not None:
                 schema.tables[table_info.name] = table_info
 
+        self._schema = schema
         return schema
     
     def get_create_statements(self) -> List[str]:
         """스키마 파일에서 CREATE TABLE 문들을 추출"""
-        if not os.path.exists(self.schema_file):
-            raise FileNotFoundError(f"스키마 파일을 찾을 수 없습니다: {self.schema_file}")
+        return list(self._get_blocks())
 
-        with open(self.schema_file, "r", encoding="utf-8") as f:
-            sql = f.read()
+    def _read(self) -> str:
+        if self._sql is None:
+            if not os.path.exists(self.schema_file):
+                raise FileNotFoundError(f"스키마 파일을 찾을 수 없습니다: {self.schema_file}")
 
-        return self._split_create_table_blocks(sql)
+            with open(self.schema_file, "r", encoding="utf-8") as f:
+                self._sql = f.read()
+        return self._sql
+
+    def _get_blocks(self) -> List[str]:
+        # CREATE TABLE 블록 단위로 분리
+        if self._blocks is None:
+            self._blocks = self._split_create_table_blocks(self._read())
+        return self._blocks
 
     def _split_create_table_blocks(self, sql: str) -> List[str]:
-        blocks = []
-        current = []
-        in_create = False
-
-        for line in sql.splitlines():
-            stripped = line.strip()
-            if stripped.upper().startswith("CREATE TABLE"):
-                if current:
-                    blocks.append("\n".join(current))
-                    current = []
-                in_create = True
-            if in_create:
-                current.append(line)
-                if stripped.endswith(";"):
-                    blocks.append("\n".join(current))
-                    current = []
-                    in_create = False
-
-        if current:
-            blocks.append("\n".join(current))
-
-        return blocks
+        return [m.group(0) for m in _CREATE_TABLE_RE.finditer(sql)]
 
     def _parse_table_block(self, block: str) -> Optional[TableInfo]:
         lines = [l.strip() for l in block.splitlines() if l.strip()]
@@ -286,56 +399,75 @@ class MySQLSchemaParser:
             return None
 
         table = TableInfo(name=name)
+        by_name: Dict[str, ColumnInfo] = {}
 
         # 컬럼 및 PRIMARY KEY 파싱
         for line in lines[1:]:
             if line.startswith(")"):
                 break
 
-            # PRIMARY KEY
-            if line.upper().startswith("PRIMARY KEY"):
-                # PRIMARY KEY (`id`)
-                if "`" in line:
-                    pk_name = line.split("`", 2)[1]
-                    table.primary_key = pk_name
-                    for c in table.columns:
-                        if c.name == pk_name:
-                            c.is_primary = True
-                continue
-
             # 컬럼 정의: `col` TYPE ...
             if line.startswith("`"):
-                try:
-                    parts = line.split()
-                    col_name = parts[0].strip("`,")
-                    col_name = col_name.strip("`")
-                    col_type = parts[1]
-                    is_nullable = "NOT NULL" not in line.upper()
-                    has_default = "DEFAULT" in line.upper()
-                    
-                    # 인라인 PRIMARY KEY 체크 (예: `id` INT AUTO_INCREMENT PRIMARY KEY)
-                    is_primary = "PRIMARY KEY" in line.upper()
-                    
-                    col = ColumnInfo(
-                        name=col_name,
-                        type=col_type,
-                        is_primary=is_primary,
-                        is_nullable=is_nullable,
-                        has_default=has_default,
-                    )
-                    table.columns.append(col)
-                    
-                    # 인라인 PRIMARY KEY인 경우 테이블의 primary_key 설정
-                    if is_primary and not table.primary_key:
-                        table.primary_key = col_name
-                        
-                except Exception:
+                m = _COLUMN_RE.match(line)
+                if not m:
                     # 파싱 실패 시 무시
                     continue
 
+                col_name, col_type = m.groups()
+                up = line.upper()
+                is_nullable = "NOT NULL" not in up
+                has_default = "DEFAULT" in up
+                is_auto_increment = "AUTO_INCREMENT" in up
+
+                # 인라인 PRIMARY KEY 체크 (예: `id` INT AUTO_INCREMENT PRIMARY KEY)
+                is_primary = "PRIMARY KEY" in up
+
+                col = ColumnInfo(
+                    name=col_name,
+                    type=col_type,
+                    is_primary=is_primary,
+                    is_nullable=is_nullable,
+                    has_default=has_default,
+                    is_auto_increment=is_auto_increment,
+                )
+                table.columns.append(col)
+                by_name[col_name] = col
+
+                # 인라인 PRIMARY KEY인 경우 테이블의 primary_key 설정
+                if is_primary and not table.primary_key:
+                    table.primary_key = col_name
+                continue
+
+            # PRIMARY KEY (`id`)
+            m = _PK_RE.match(line)
+            if m:
+                pk_name = m.group(1)
+                table.primary_key = pk_name
+                col = by_name.get(pk_name)
+                if col:
+                    col.is_primary = True
+
         return table
 
 
+@functools.lru_cache(maxsize=16)
+def _load_schema_cached(schema_file: str, mtime_ns: int) -> Tuple[SchemaInfo, Tuple[str, ...]]:
+    parser = MySQLSchemaParser(schema_file)
+    return parser.parse(), tuple(parser.get_create_statements())
+
+
+def load_schema(schema_file: str) -> Tuple[SchemaInfo, List[str]]:
+    """
+    스키마 파일 파싱 결과 (SchemaInfo, CREATE TABLE 문 목록) 반환
+    - 파일 수정 시각이 같으면 이전 파싱 결과를 재사용 (메뉴 동작마다 다시 읽지 않음)
+    """
+    if not os.path.exists(schema_file):
+        raise FileNotFoundError(f"스키마 파일을 찾을 수 없습니다: {schema_file}")
+
+    schema, statements = _load_schema_cached(os.path.abspath(schema_file), os.stat(schema_file).st_mtime_ns)
+    return schema, list(statements)
+
+
 # ==========================
 # 시나리오 로더
 # ==========================
@@ -396,7 +528,7 @@ class SchemaCreator:
         self.conn = None
     
     def connect(self):
-        self.conn = mysql.connector.connect(**self.db_config)
+        self.conn = ConnectionPool.get_connection(self.db_config)
     
     def close(self):
         if self.conn:
@@ -426,8 +558,7 @@ class SchemaCreator:
         existing_tables = self.get_existing_tables()
         
         # CREATE TABLE 문 추출
-        parser = MySQLSchemaParser(self.schema_file)
-        create_statements = parser.get_create_statements()
+        _, create_statements = load_schema(self.schema_file)
         
         results = {}
         cursor = self.conn.cursor()
@@ -485,6 +616,24 @@ class SchemaCreator:
 # MySQL 연결 & 데이터 생성
 # ==========================
 
+# LOAD DATA 기본 형식(탭 구분, '\\' 이스케이프)에 맞춘 필드 변환
+_TSV_ESCAPE = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n"})
+
+
+# PK 타입 판별: INT/INTEGER/BIGINT 등 (POINT처럼 이름에 INT가 들어간 타입은 제외) / 선언 길이 "(n)"
+_INT_TYPE_RE = re.compile(r"\b(?:TINY|SMALL|MEDIUM|BIG)?INT(?:EGER)?\b", re.IGNORECASE)
+_TYPE_LENGTH_RE = re.compile(r"\(\s*(\d+)")
+STRING_PK_LENGTH = 12  # 문자열 PK 기본 길이 (선언 길이가 더 짧으면 그 길이)
+
+
+def _tsv_field(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, int):
+        return str(value)
+    return str(value).translate(_TSV_ESCAPE)
+
+
 class TestDataGenerator:
     """
     - 스키마/시나리오 기반으로 랜덤 데이터를 생성하여 INSERT
@@ -498,10 +647,16 @@ class TestDataGenerator:
         self.profile = profile
         self.scenario_name = scenario_name
         self.conn = None
+        self._autoinc_settings: Optional[Tuple[int, int]] = None  # (lock_mode, increment)
+        self._load_infile_enabled = True  # 서버가 LOCAL INFILE을 거부하면 False
 
     def connect(self):
-        self.conn = mysql.connector.connect(**self.db_config)
-        self.conn.autocommit = False  # 트랜잭션 사용
+        # 트랜잭션 사용 (풀 연결은 autocommit=False)
+        config = self.db_config
+        if any(stable.count >= LOAD_INFILE_THRESHOLD for stable in self.scenario.tables.values()):
+            # 대량 테이블 적재용 LOAD DATA LOCAL INFILE 허용
+            config = dict(config, allow_local_infile=True)
+        self.conn = ConnectionPool.get_connection(config)
 
     def close(self):
         if self.conn:
@@ -518,11 +673,21 @@ class TestDataGenerator:
         if not self.conn:
             self.connect()
 
+        # INSERT는 prepared statement로 실행 (전체 배치용 / 마지막 부분 배치용)
+        # 그 외 조회는 prepared statement가 다시 준비되지 않도록 일반 커서 사용
         cursor = self.conn.cursor()
+        batch_cursor = self._prepared_cursor()
+        tail_cursor = self._prepared_cursor()
         run_id = datetime.now().strftime("%Y%m%d%H%M%S")
         inserted_rows: Dict[str, List[int]] = {}
+        fk_checks_disabled = False
 
         try:
+            # 모든 FK 값을 relations로 직접 채우는 경우 서버 측 FK 검사 생략
+            if self._fk_checks_skippable(cursor):
+                cursor.execute("SET @saved_fk_checks = @@SESSION.foreign_key_checks, SESSION foreign_key_checks = 0")
+                fk_checks_disabled = True
+
             # 전체 카운트 계산
             total_count = sum(stable.count for stable in self.scenario.tables.values())
             current_count = 0
@@ -542,17 +707,57 @@ class TestDataGenerator:
 
                 inserted_rows[tname] = []
 
-                for i in range(stable.count):
-                    col_names, values = self._build_row_values(table_info, stable, inserted_rows)
-                    placeholders = ", ".join(["%s"] * len(values))
-                    cols_part = ", ".join(f"`{c}`" for c in col_names)
+                # AUTO_INCREMENT가 아닌 PK는 값을 미리 만들어 INSERT에 포함 (ID 조회 왕복 불필요)
+                pk_col = next((c for c in table_info.columns if c.name == table_info.primary_key), None)
+                pk_values = None
+                if pk_col is not None and not pk_col.is_auto_increment:
+                    if pk_col.name in stable.relations:
+                        # PK가 FK이기도 한 경우 (1:1 관계): 부모 PK를 중복 없이 골라 사용
+                        pk_values = self._relation_pk_values(tname, pk_col, stable, inserted_rows)
+                    else:
+                        pk_values = self._generate_pk_values(cursor, tname, pk_col, stable.count)
+
+                # INSERT 대상 컬럼은 테이블 단위로 고정이므로 SQL 템플릿도 한 번만 생성
+                columns = self._column_plan(table_info)
+                cols_part = ", ".join(f"`{c.name}`" for c in columns)
+                row_placeholder = "(" + ", ".join(["%s"] * len(columns)) + ")"
+                insert_prefix = f"INSERT INTO `{tname}` ({cols_part}) VALUES "
+                max_rows = min(INSERT_BATCH_SIZE, MAX_PREPARED_PLACEHOLDERS // max(1, len(columns)))
+                batch_sql = insert_prefix + ", ".join([row_placeholder] * max_rows)
+                generators = self._plan_generators(columns, stable, inserted_rows, pk_values)
+
+                # 대량 테이블은 LOAD DATA LOCAL INFILE 한 문장으로 적재 (불가하면 INSERT로 진행)
+                if self._use_load_infile(tname, stable):
+                    loaded = self._load_infile(
+                        cursor, tname, table_info.primary_key, columns, generators, stable.count, pk_values
+                    )
+                    if loaded is not None:
+                        inserted_rows[tname].extend(loaded)
+                        current_count += stable.count
+                        if progress_callback and total_count > 0:
+                            progress_callback(tname, current_count, total_count)
+                        continue
+
+                # 행마다 왕복하지 않도록 max_rows 단위 multi-row INSERT로 삽입
+                for start in range(0, stable.count, max_rows):
+                    batch_size = min(max_rows, stable.count - start)
+                    batch_pks = pk_values[start:start + batch_size] if pk_values is not None else None
+                    rows = self._build_rows(generators, start, batch_size)
+
+                    if batch_size == max_rows:
+                        insert_cursor, sql = batch_cursor, batch_sql
+                    else:
+                        insert_cursor = tail_cursor
+                        sql = insert_prefix + ", ".join([row_placeholder] * batch_size)
+                    insert_cursor.execute(sql, [v for row in rows for v in row])
+                    if batch_pks is not None:
+                        inserted_rows[tname].extend(batch_pks)
+                    else:
+                        inserted_rows[tname].extend(
+                            self._inserted_pks(insert_cursor.lastrowid, cursor, tname, table_info.primary_key, len(rows))
+                        )
 
-                    sql = f"INSERT INTO `{tname}` ({cols_part}) VALUES ({placeholders})"
-                    cursor.execute(sql, values)
-                    pk_val = cursor.lastrowid
-                    inserted_rows[tname].append(pk_val)
-                    
-                    current_count += 1
+                    current_count += len(rows)
                     if progress_callback and total_count > 0:
                         progress_callback(tname, current_count, total_count)
 
@@ -561,6 +766,13 @@ class TestDataGenerator:
             self.conn.rollback()
             raise e
         finally:
+            if fk_checks_disabled:
+                try:
+                    cursor.execute("SET SESSION foreign_key_checks = @saved_fk_checks")
+                except mysql.connector.Error:
+                    pass
+            tail_cursor.close()
+            batch_cursor.close()
             cursor.close()
 
         run_log = RunLogEntry(
@@ -573,63 +785,298 @@ class TestDataGenerator:
         self._save_run_log(run_log)
         return run_log
 
-    def _build_row_values(
+    def _use_load_infile(self, tname: str, stable: ScenarioTable) -> bool:
+        """LOAD DATA 적재 대상 여부 (자기 참조 FK는 배치마다 부모가 늘어나야 하므로 제외)"""
+        if not self._load_infile_enabled or stable.count < LOAD_INFILE_THRESHOLD:
+            return False
+        return all(rel.split(".")[0] != tname for rel in stable.relations.values())
+
+    def _load_infile(
+        self,
+        cursor,
+        tname: str,
+        pk: str,
+        columns: List[ColumnInfo],
+        generators: List[Callable[[int, int], List[Any]]],
+        count: int,
+        pk_values: Optional[List[Any]],
+    ) -> Optional[List[Any]]:
+        """
+        레코드를 TSV 임시 파일로 만든 뒤 LOAD DATA LOCAL INFILE 한 문장으로 적재
+        반환: 생성된 PK 목록 (서버/드라이버가 LOCAL INFILE을 허용하지 않으면 None)
+        """
+        fd, path = tempfile.mkstemp(prefix=f"{tname}_", suffix=".tsv")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+                for start in range(0, count, INSERT_BATCH_SIZE):
+                    n = min(INSERT_BATCH_SIZE, count - start)
+                    f.writelines(
+                        "\t".join([_tsv_field(v) for v in row]) + "\n"
+                        for row in self._build_rows(generators, start, n)
+                    )
+
+            cols_part = ", ".join(f"`{c.name}`" for c in columns)
+            try:
+                cursor.execute(
+                    f"LOAD DATA LOCAL INFILE %s INTO TABLE `{tname}` CHARACTER SET utf8mb4 ({cols_part})",
+                    (path,),
+                )
+            except mysql.connector.Error:
+                # local_infile 비활성화 등: 이후 테이블도 multi-row INSERT 사용
+                self._load_infile_enabled = False
+                return None
+        finally:
+            os.remove(path)
+
+        cursor.execute("SELECT LAST_INSERT_ID(), ROW_COUNT()")
+        first_id, row_count = cursor.fetchone()
+        if row_count != count:
+            # LOCAL 적재는 중복/변환 오류를 경고로 넘기므로 누락 시 run 전체를 롤백
+            raise RuntimeError(f"'{tname}' LOAD DATA 적재 건수 불일치: {row_count}/{count}")
+
+        if pk_values is not None:
+            return pk_values
+        return self._inserted_pks(first_id, cursor, tname, pk, count)
+
+    def _fk_checks_skippable(self, cursor) -> bool:
+        """
+        DB에 정의된 FK 컬럼이 전부 시나리오 relations로 채워지는지 확인
+        (relations 밖의 FK 컬럼이 있으면 랜덤 값이 들어가므로 서버 검사 유지)
+        """
+        cursor.execute(
+            "SELECT TABLE_NAME, COLUMN_NAME FROM information_schema.KEY_COLUMN_USAGE "
+            "WHERE TABLE_SCHEMA = DATABASE() AND REFERENCED_TABLE_NAME IS NOT NULL"
+        )
+        for tname, col_name in cursor.fetchall():
+            stable = self.scenario.tables.get(tname)
+            if stable is None or stable.count <= 0:
+                continue
+            if col_name not in stable.relations:
+                return False
+            # PK 컬럼의 relation은 값 생성 방식이 다르므로 (부모 PK 재사용) 서버 검사 유지
+            table_info = self.schema.tables.get(tname)
+            if table_info is not None and table_info.primary_key == col_name:
+                return False
+        return True
+
+    def _prepared_cursor(self):
+        """서버 측 prepared statement 커서 (드라이버가 지원하지 않으면 일반 커서)"""
+        try:
+            return self.conn.cursor(prepared=True)
+        except (mysql.connector.Error, ValueError):
+            return self.conn.cursor()
+
+    def _get_autoinc_settings(self) -> Tuple[int, int]:
+        """서버의 (innodb_autoinc_lock_mode, auto_increment_increment) 조회 (최초 1회)"""
+        if self._autoinc_settings is None:
+            cursor = self.conn.cursor()
+            try:
+                cursor.execute("SELECT @@innodb_autoinc_lock_mode, @@auto_increment_increment")
+                lock_mode, increment = cursor.fetchone()
+                self._autoinc_settings = (int(lock_mode), int(increment))
+            except mysql.connector.Error:
+                # 조회 불가 시 연속성을 가정하지 않는 안전한 경로 사용
+                self._autoinc_settings = (2, 1)
+            finally:
+                cursor.close()
+        return self._autoinc_settings
+
+    def _inserted_pks(self, first_id: int, cursor, tname: str, pk: str, count: int) -> List[int]:
+        """
+        직전 multi-row INSERT로 생성된 AUTO_INCREMENT PK 목록 복원
+        - lock_mode <= 1: 한 문장의 ID는 연속 할당되므로 lastrowid부터 계산
+        - lock_mode = 2: 연속성이 보장되지 않으므로 첫 ID 이후 count개를 다시 조회
+          (락 파일로 단일 실행이 보장된다는 전제)
+        """
+        lock_mode, increment = self._get_autoinc_settings()
+        if lock_mode <= 1:
+            return [first_id + i * increment for i in range(count)]
+
+        cursor.execute(
+            f"SELECT `{pk}` FROM `{tname}` WHERE `{pk}` >= %s ORDER BY `{pk}` LIMIT %s",
+            (first_id, count),
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+    def _relation_pk_values(
         self,
-        table_info: TableInfo,
+        tname: str,
+        pk_col: ColumnInfo,
+        stable: ScenarioTable,
+        inserted_rows: Dict[str, List[int]],
+    ) -> List[Any]:
+        """
+        relations가 걸린 PK 값 생성 - 이번 실행에서 삽입한 부모 PK 중 중복 없이 count개 선택
+        (부모 레코드 수가 부족하거나 자기 참조이면 PK 중복/고아 레코드가 생기므로 오류)
+        """
+        parent_table = stable.relations[pk_col.name].split(".")[0]
+        if parent_table == tname:
+            raise ValueError(f"'{tname}.{pk_col.name}': PK는 자기 자신의 테이블을 참조할 수 없습니다")
+
+        parent_ids = inserted_rows.get(parent_table, [])
+        if len(parent_ids) < stable.count:
+            raise ValueError(
+                f"'{tname}.{pk_col.name}' PK는 '{parent_table}' PK를 그대로 사용하므로 "
+                f"레코드 수({stable.count})가 부모 레코드 수({len(parent_ids)})보다 많을 수 없습니다"
+            )
+        return random.sample(parent_ids, stable.count)
+
+    def _generate_pk_values(self, cursor, tname: str, pk_col: ColumnInfo, count: int) -> List[Any]:
+        """
+        AUTO_INCREMENT가 아닌 PK 값 생성
+        - INT류: 현재 MAX(pk) + 1부터 순차 증가
+        - 그 외: 선언 길이(CHAR(8) 등) 이내의 랜덤 문자열
+          (대소문자 무시 콜레이션 기준으로 서로 겹치지 않고, 테이블에 이미 있는 값과도 겹치지 않게)
+        """
+        if _INT_TYPE_RE.search(pk_col.type):
+            cursor.execute(f"SELECT MAX(`{pk_col.name}`) FROM `{tname}`")
+            row = cursor.fetchone()
+            start = (row[0] or 0) + 1 if row else 1
+            return list(range(start, start + count))
+
+        m = _TYPE_LENGTH_RE.search(pk_col.type)
+        length = min(STRING_PK_LENGTH, int(m.group(1))) if m else STRING_PK_LENGTH
+
+        # 대소문자 무시 기준으로 만들 수 있는 값의 수 (영문 26 + 숫자 10)
+        if 36 ** length < count:
+            raise ValueError(
+                f"'{tname}.{pk_col.name}' ({pk_col.type}) 길이로는 중복 없는 PK {count}개를 만들 수 없습니다"
+            )
+
+        values: Dict[str, str] = {}  # 소문자 -> 값
+        stalled = 0
+        while len(values) < count:
+            candidates = {}
+            for v in random_strings(length, count - len(values)):
+                key = v.lower()
+                if key not in values:
+                    candidates.setdefault(key, v)
+            for existing in self._existing_pks(cursor, tname, pk_col.name, list(candidates.values())):
+                candidates.pop(str(existing).lower(), None)
+            if not candidates:
+                # 남은 값이 거의 없으면 (기존 레코드가 대부분 차지) 무한 반복하지 않고 중단
+                stalled += 1
+                if stalled >= 100:
+                    raise ValueError(f"'{tname}.{pk_col.name}'에 추가할 수 있는 중복 없는 PK 값이 부족합니다")
+                continue
+            stalled = 0
+            values.update(candidates)
+        return list(values.values())
+
+    @staticmethod
+    def _existing_pks(cursor, tname: str, pk: str, values: List[str]) -> List[Any]:
+        """values 중 테이블에 이미 있는 PK 값 조회 (INSERT_BATCH_SIZE 단위)"""
+        existing = []
+        for start in range(0, len(values), INSERT_BATCH_SIZE):
+            ch = values[start:start + INSERT_BATCH_SIZE]
+            placeholders = ", ".join(["%s"] * len(ch))
+            cursor.execute(f"SELECT `{pk}` FROM `{tname}` WHERE `{pk}` IN ({placeholders})", ch)
+            existing.extend(row[0] for row in cursor.fetchall())
+        return existing
+
+    def _column_plan(self, table_info: TableInfo) -> List[ColumnInfo]:
+        """INSERT 대상 컬럼 목록 (AUTO_INCREMENT PK는 MySQL이 자동 생성하므로 생략)"""
+        return [c for c in table_info.columns if not (c.is_primary and c.is_auto_increment)]
+
+    def _build_rows(
+        self,
+        generators: List[Callable[[int, int], List[Any]]],
+        start: int,
+        n: int,
+    ) -> List[Tuple[Any, ...]]:
+        """
+        start번째 레코드부터 n개 레코드의 값을 컬럼 단위로 한 번에 생성
+        반환: [레코드 값 튜플, ...] - 값 순서는 generators(_plan_generators 결과)와 동일
+        """
+        values = [gen(start, n) for gen in generators]
+        return list(zip(*values)) if values else [()] * n
+
+    def _plan_generators(
+        self,
+        columns: List[ColumnInfo],
         scenario_table: ScenarioTable,
         inserted_rows: Dict[str, List[int]],
-    ) -> Tuple[List[str], List[Any]]:
+        pk_values: Optional[List[Any]] = None,
+    ) -> List[Callable[[int, int], List[Any]]]:
         """
-        단순한 랜덤 값 생성 + relations 반영
+        컬럼별 값 생성 함수를 테이블 단위로 한 번만 결정 (레코드마다 타입을 다시 판별하지 않도록)
+        각 함수는 (start, n) -> start번째 레코드부터 n개의 값 목록
         - VARCHAR류: 랜덤 문자열
         - INT류: 랜덤 정수
-        - relations에 정의된 FK는 부모 테이블에서 랜덤 PK 선택
+        - DATE/TIME류: 현재 날짜/시간 문자열
+        - relations에 정의된 FK: 부모 테이블에서 랜덤 PK 선택
+          (부모 PK 목록은 튜플로 고정, 자기 참조는 배치마다 늘어나는 목록을 그대로 참조)
+        - AUTO_INCREMENT가 아닌 PK: pk_values 사용 (relations가 걸린 PK는 부모 PK 중에서 미리 고른 값)
         """
-        col_names = []
-        values = []
+        generators = []
+        now = datetime.now()
 
-        for col in table_info.columns:
-            # AUTO_INCREMENT PK는 INSERT 시 생략 (MySQL이 자동 생성)
+        for col in columns:
             if col.is_primary:
-                continue
+                gen = self._slice_generator(pk_values)
 
             # relations 처리 (FK)
-            if col.name in scenario_table.relations:
+            elif col.name in scenario_table.relations:
                 rel = scenario_table.relations[col.name]  # "parent_table.parent_pk"
                 parent_table, parent_pk = rel.split(".")
                 parent_ids = inserted_rows.get(parent_table, [])
-                if not parent_ids:
-                    # 부모 데이터가 아직 없으면 NULL (또는 나중에 보완 가능)
-                    val = None
-                else:
-                    val = random.choice(parent_ids)
+                if parent_table != scenario_table.name:
+                    parent_ids = tuple(parent_ids)
+                gen = self._choice_generator(parent_ids)
             else:
                 # 타입에 따른 간단 값 생성
                 upper_type = col.type.upper()
                 if "INT" in upper_type:
-                    val = random_int()
+                    gen = self._int_generator(1, 10000)
                 elif "CHAR" in upper_type or "TEXT" in upper_type:
-                    val = random_string(12)
+                    gen = self._string_generator(12)
                 elif "DATE" in upper_type or "TIME" in upper_type:
                     # 아주 단순히 현재 날짜/시간 문자열
                     if "DATETIME" in upper_type or "TIMESTAMP" in upper_type:
-                        val = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                        gen = self._const_generator(now.strftime("%Y-%m-%d %H:%M:%S"))
                     else:
-                        val = datetime.now().strftime("%Y-%m-%d")
+                        gen = self._const_generator(now.strftime("%Y-%m-%d"))
                 else:
                     # 기타 타입은 문자열로 대체
-                    val = random_string(8)
+                    gen = self._string_generator(8)
+
+            generators.append(gen)
 
-            col_names.append(col.name)
-            values.append(val)
+        return generators
 
-        return col_names, values
+    @staticmethod
+    def _slice_generator(values: Optional[List[Any]]) -> Callable[[int, int], List[Any]]:
+        if values is None:
+            return lambda start, n: [None] * n
+        return lambda start, n: values[start:start + n]
+
+    @staticmethod
+    def _choice_generator(parent_ids) -> Callable[[int, int], List[Any]]:
+        def gen(start: int, n: int) -> List[Any]:
+            if not parent_ids:
+                # 부모 데이터가 아직 없으면 NULL (또는 나중에 보완 가능)
+                return [None] * n
+            return random.choices(parent_ids, k=n)
+        return gen
+
+    @staticmethod
+    def _int_generator(min_val: int, max_val: int) -> Callable[[int, int], List[Any]]:
+        return lambda start, n: random_ints(n, min_val, max_val)
+
+    @staticmethod
+    def _string_generator(length: int) -> Callable[[int, int], List[Any]]:
+        return lambda start, n: random_strings(length, n)
+
+    @staticmethod
+    def _const_generator(value: Any) -> Callable[[int, int], List[Any]]:
+        return lambda start, n: [value] * n
 
     def _save_run_log(self, run_log: RunLogEntry):
         # 시나리오 파일명에서 확장자 제거
         scenario_name = os.path.splitext(run_log.scenario)[0]
         work_path = ensure_work_dir(run_log.profile, scenario_name)
         path = os.path.join(work_path, f"run_{run_log.run_id}.json")
+        _RUN_META_CACHE.pop(path, None)
         with open(path, "w", encoding="utf-8") as f:
             json.dump(
                 {
@@ -637,7 +1084,13 @@ class TestDataGenerator:
                     "created_at": run_log.created_at,
                     "profile": run_log.profile,
                     "scenario": run_log.scenario,
+                    "format_version": RUN_LOG_FORMAT_VERSION,
+                    # 이전 빌드 호환용 PK 목록 (이전 빌드는 이 키만 읽어 롤백)
                     "inserted_rows": run_log.inserted_rows,
+                    # PK를 [start, count] 구간으로도 저장 (AUTO_INCREMENT PK는 대부분 한 구간) - 현재 빌드는 이 키로 롤백
+                    "inserted_rows_ranges": {
+                        tname: compress_id_ranges(ids) for tname, ids in run_log.inserted_rows.items()
+                    },
                 },
                 f,
                 indent=2,
@@ -649,6 +1102,9 @@ class TestDataGenerator:
 # 롤백 매니저
 # ==========================
 
+# run 로그 메타데이터 캐시: file_path -> ((st_mtime_ns, st_size), {"run_id": ..., ...})
+_RUN_META_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+
 class RollbackManager:
     """
     run_YYYYMMDDHHMMSS.json 파일을 기반으로 INSERT 했던 레코드를 DELETE.
@@ -668,30 +1124,51 @@ class RollbackManager:
             return []
         
         runs = []
+        seen = set()
         # work 디렉토리 내 모든 프로파일_시나리오 폴더 스캔
-        for profile_scenario_dir in os.listdir(WORK_DIR):
-            dir_path = os.path.join(WORK_DIR, profile_scenario_dir)
-            if not os.path.isdir(dir_path):
-                continue
-            
-            # 각 폴더 내의 run_*.json 파일 스캔
-            for f in os.listdir(dir_path):
-                if not (f.startswith("run_") and f.endswith(".json")):
-                    continue
-                
-                file_path = os.path.join(dir_path, f)
-                try:
-                    with open(file_path, "r", encoding="utf-8") as fp:
-                        data = json.load(fp)
-                        runs.append({
-                            "run_id": data.get("run_id", ""),
-                            "created_at": data.get("created_at", ""),
-                            "profile": data.get("profile", "N/A"),
-                            "scenario": data.get("scenario", "N/A"),
-                            "file_path": file_path,  # 전체 경로 저장
-                        })
-                except Exception:
+        with os.scandir(WORK_DIR) as dirs:
+            for dir_entry in dirs:
+                if not dir_entry.is_dir():
                     continue
+
+                # 각 폴더 내의 run_*.json 파일 스캔
+                with os.scandir(dir_entry.path) as files:
+                    for entry in files:
+                        if not (entry.name.startswith("run_") and entry.name.endswith(".json")):
+                            continue
+
+                        file_path = entry.path
+                        seen.add(file_path)
+                        # 파일이 바뀌지 않았으면 다시 파싱하지 않고 캐시 사용
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        key = (st.st_mtime_ns, st.st_size)
+                        cached = _RUN_META_CACHE.get(file_path)
+                        if cached and cached[0] == key:
+                            runs.append(dict(cached[1], file_path=file_path))
+                            continue
+
+                        try:
+                            with open(file_path, "r", encoding="utf-8") as fp:
+                                data = json.load(fp)
+
+                            meta = {
+                                "run_id": data.get("run_id", ""),
+                                "created_at": data.get("created_at", ""),
+                                "profile": data.get("profile", "N/A"),
+                                "scenario": data.get("scenario", "N/A"),
+                            }
+                        except Exception:
+                            # 읽을 수 없거나 최상위가 객체가 아닌 파일은 건너뜀
+                            continue
+                        _RUN_META_CACHE[file_path] = (key, meta)
+                        runs.append(dict(meta, file_path=file_path))  # 전체 경로 저장
+
+        # 삭제된 파일의 캐시 정리
+        for stale in _RUN_META_CACHE.keys() - seen:
+            del _RUN_META_CACHE[stale]
         
         # 최신순 정렬
         runs.sort(key=lambda x: x["run_id"], reverse=True)
@@ -704,29 +1181,47 @@ class RollbackManager:
         with open(file_path, "r", encoding="utf-8") as f:
             data = json.load(f)
 
-        inserted_rows = data.get("inserted_rows", {})
+        format_version = data.get("format_version", 1)
+        if format_version > RUN_LOG_FORMAT_VERSION:
+            return f"지원하지 않는 run 로그 형식입니다 (format_version={format_version}): {file_path}"
+
+        if format_version >= 2 or "inserted_rows_ranges" in data:
+            inserted_ranges = data.get("inserted_rows_ranges", {})
+        else:
+            # 이전 형식: {"table": [pk, pk, ...]}
+            inserted_ranges = {
+                tname: compress_id_ranges(ids) for tname, ids in data.get("inserted_rows", {}).items()
+            }
 
-        conn = mysql.connector.connect(**self.db_config)
-        conn.autocommit = False
+        conn = ConnectionPool.get_connection(self.db_config)
         cursor = conn.cursor()
 
         try:
             # 자식 테이블 → 부모 테이블 순서로 삭제하는 것이 안전하지만,
             # 여기서는 단순히 테이블 이름 역순으로 처리 (필요시 개선)
-            for tname in reversed(list(inserted_rows.keys())):
+            for tname in reversed(list(inserted_ranges.keys())):
                 if tname not in self.schema.tables:
                     continue
                 table_info = self.schema.tables[tname]
                 pk = table_info.primary_key
                 if not pk:
                     continue
-                ids = inserted_rows[tname]
-                if not ids:
+                ranges = inserted_ranges[tname]
+                if not ranges:
                     continue
 
-                # 단순 IN 삭제 (배치 크기 조절 가능)
-                chunks = [ids[i:i + 100] for i in range(0, len(ids), 100)]
-                for ch in chunks:
+                # 연속 구간은 PK 범위 스캔 한 번으로 삭제
+                ids = []
+                for first, count in ranges:
+                    if count > 1:
+                        sql = f"DELETE FROM `{tname}` WHERE `{pk}` BETWEEN %s AND %s"
+                        cursor.execute(sql, (first, first + count - 1))
+                    else:
+                        ids.append(first)
+
+                # 나머지 PK는 IN 삭제 (ROLLBACK_BATCH_SIZE 단위)
+                for start in range(0, len(ids), ROLLBACK_BATCH_SIZE):
+                    ch = ids[start:start + ROLLBACK_BATCH_SIZE]
                     placeholders = ", ".join(["%s"] * len(ch))
                     sql = f"DELETE FROM `{tname}` WHERE `{pk}` IN ({placeholders})"
                     cursor.execute(sql, ch)
@@ -734,8 +1229,6 @@ class RollbackManager:
             conn.commit()
         except Exception as e:
             conn.rollback()
-            cursor.close()
-            conn.close()
             return f"롤백 중 오류 발생: {e}"
         finally:
             cursor.close()
@@ -756,9 +1249,16 @@ class MySQLDumpManager:
     def __init__(self, db_config: Dict[str, Any]):
         self.db_config = db_config
 
-    def dump(self, output_filename: str, tables: Optional[List[str]] = None) -> str:
+    def dump(self, output_filename: str, tables: Optional[List[str]] = None, compress: bool = False) -> str:
+        """
+        mysqldump 출력을 dump/ 디렉토리 파일로 저장
+        - 출력은 파이썬을 거치지 않고 자식 프로세스가 파일에 직접 기록 (메모리에 모으지 않음)
+        - compress=True: mysqldump | gzip 파이프로 압축하며 저장 (.gz 확장자 추가)
+        """
         # dump 디렉토리 생성
         dump_dir = ensure_dump_dir()
+        if compress and not output_filename.endswith(".gz"):
+            output_filename += ".gz"
         output_file = os.path.join(dump_dir, output_filename)
         
         # localhost를 127.0.0.1로 변경 (TCP 연결 강제)
@@ -772,6 +1272,8 @@ class MySQLDumpManager:
             "-P", str(self.db_config["port"]),
             "-u", self.db_config["user"],
             "--protocol=TCP",  # TCP 연결 강제
+            "--single-transaction",  # 테이블 락 없이 일관된 스냅샷 덤프 (InnoDB)
+            "--quick",  # 결과를 서버/클라이언트 메모리에 버퍼링하지 않고 행 단위 스트리밍
             self.db_config["database"],
         ]
         if tables:
@@ -782,8 +1284,12 @@ class MySQLDumpManager:
         env["MYSQL_PWD"] = self.db_config["password"]
 
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE, check=True, env=env)
+            # mysqldump 출력 바이트를 그대로 파일에 기록 (텍스트 인코딩 계층 없음)
+            with open(output_file, "wb") as f:
+                if compress:
+                    self._dump_gzip(cmd, env, f)
+                else:
+                    subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE, check=True, env=env)
             return f"mysqldump 완료: {output_file}"
         except subprocess.CalledProcessError as e:
             error_msg = e.stderr.decode('utf-8') if e.stderr else str(e)
@@ -791,6 +1297,30 @@ class MySQLDumpManager:
         except Exception as e:
             return f"mysqldump 오류: {e}"
 
+    @staticmethod
+    def _dump_gzip(cmd: List[str], env: Dict[str, str], out) -> None:
+        """mysqldump | gzip > out (두 프로세스를 OS 파이프로 직접 연결)"""
+        # stderr는 임시 파일로 받음 (PIPE로 받으면 경고가 많을 때 버퍼가 차서 mysqldump가 멈출 수 있음)
+        with tempfile.TemporaryFile() as err:
+            dump_proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err, env=env)
+            try:
+                gzip_proc = subprocess.Popen(["gzip", "-c"], stdin=dump_proc.stdout, stdout=out)
+            except BaseException:
+                # gzip을 띄우지 못하면 mysqldump가 남지 않도록 정리
+                dump_proc.kill()
+                dump_proc.wait()
+                dump_proc.stdout.close()
+                raise
+            dump_proc.stdout.close()  # gzip이 먼저 종료되면 mysqldump가 SIGPIPE를 받도록
+
+            gzip_rc = gzip_proc.wait()
+            dump_rc = dump_proc.wait()
+            if dump_rc != 0:
+                err.seek(0)
+                raise subprocess.CalledProcessError(dump_rc, cmd, stderr=err.read())
+            if gzip_rc != 0:
+                raise subprocess.CalledProcessError(gzip_rc, ["gzip", "-c"])
+
 
 # ==========================
 # TUI 애플리케이션
@@ -808,23 +1338,111 @@ MENU_ITEMS = [
 ]
 
 
+class OperationCancelled(Exception):
+    """TUI에서 실행 중인 작업을 사용자가 취소함"""
+
+    def __init__(self):
+        super().__init__("사용자가 작업을 취소했습니다")
+
+
+# 동기화 업데이트(DEC private mode 2026) 시작/끝 - 지원 터미널은 그 사이 출력을 한 프레임으로 표시, 미지원 터미널은 무시
+SYNC_UPDATE_BEGIN = b"\x1b[?2026h"
+SYNC_UPDATE_END = b"\x1b[?2026l"
+
+
+def _sync_update_supported() -> bool:
+    """
+    동기화 업데이트 시퀀스를 써도 되는 터미널인지 판단
+    - Windows 콘솔(PDCurses)은 VT 처리가 꺼져 있으면 시퀀스가 그대로 글자로 보이므로 사용하지 않음
+    - TERM이 없거나 dumb이면 사용하지 않음
+    """
+    if sys.platform == "win32":
+        return False
+    return os.environ.get("TERM", "dumb") not in ("", "dumb") and sys.stdout.isatty()
+
+
+def _display_width(text: str) -> int:
+    """터미널 표시 폭 (한글 등 전각 문자는 2칸)"""
+    return sum(2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1 for ch in text)
+
+
+# 한 줄 출력에 섞인 제어 문자(줄바꿈/탭 등)는 공백으로 바꿔 다음 줄이나 커서 위치를 건드리지 않게 함
+_CONTROL_CHARS = dict.fromkeys([*range(32), 127], " ")
+
+
+def _clip(text: str, width: int) -> str:
+    """터미널 표시 폭 기준으로 문자열 자르기 (줄바꿈으로 다음 줄을 덮어쓰지 않도록)"""
+    if len(text) * 2 <= width:
+        return text
+    used = 0
+    for i, ch in enumerate(text):
+        used += 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+        if used > width:
+            return text[:i]
+    return text
+
+
+class _LazyFormatList(Sequence):
+    """인덱스로 꺼낼 때만 fmt로 문자열을 만드는 읽기 전용 목록 (선택 메뉴에 화면에 보이는 항목만 포맷)"""
+
+    def __init__(self, items: List[Any], fmt: Callable[[Any], str]):
+        self._items = items
+        self._fmt = fmt
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self._fmt(item) for item in self._items[idx]]
+        return self._fmt(self._items[idx])
+
+
+LOG_TIMESTAMP_WIDTH = len("[00:00:00] ")  # add_log가 붙이는 타임스탬프 폭
+_UNSET = object()  # AppState 표시 문자열 캐시의 초기값 (어떤 상태 값과도 같지 않음)
+
+
 @dataclass
 class AppState:
     current_profile: Optional[str] = None
     current_scenario: Optional[str] = None
+    schema_file: Optional[str] = None  # 선택된 프로파일의 schema.sql 경로
     schema: Optional[SchemaInfo] = None
     scenario: Optional[ScenarioInfo] = None
     db_config: Optional[Dict[str, Any]] = None
     last_message: str = ""
     progress: str = ""
     current_menu: int = 1
-    log_messages: List[str] = field(default_factory=list)
+    # 최근 100개만 유지 (초과 시 가장 오래된 로그가 자동으로 빠짐)
+    log_messages: Deque[str] = field(default_factory=lambda: deque(maxlen=100))
+
+    # 화면 표시 문자열 캐시 (원본 값 객체가 그대로면 다시 포맷하지 않음)
+    _info_src: Tuple[Any, Any] = field(default=(_UNSET, _UNSET), init=False, repr=False, compare=False)
+    _info_line: str = field(default="", init=False, repr=False, compare=False)
+    _progress_src: Any = field(default=_UNSET, init=False, repr=False, compare=False)
+    _progress_line: str = field(default="", init=False, repr=False, compare=False)
+
+    @property
+    def info_line(self) -> str:
+        """상단 설정 정보 줄 (프로파일/시나리오가 바뀔 때만 다시 만듦)"""
+        profile, scenario = self._info_src
+        if profile is not self.current_profile or scenario is not self.current_scenario:
+            self._info_src = (self.current_profile, self.current_scenario)
+            self._info_line = f"Profile: {self.current_profile or 'None'} | Scenario: {self.current_scenario or 'None'}"
+        return self._info_line
+
+    @property
+    def progress_line(self) -> str:
+        """하단 진행 상태 줄 (progress가 바뀔 때만 다시 만듦)"""
+        if self._progress_src is not self.progress:
+            self._progress_src = self.progress
+            self._progress_line = f"[진행] {self.progress or '대기 중...'}"
+        return self._progress_line
     
     def add_log(self, message: str):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_messages.append(f"[{timestamp}] {message}")
-        if len(self.log_messages) > 100:
-            self.log_messages = self.log_messages[-100:]
+        # HH:MM:SS 고정 형식이라 strftime 대신 localtime 필드로 직접 포맷
+        t = time.localtime()
+        self.log_messages.append(f"[{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}] {message}")
 
 
 class TUIApplication:
@@ -841,10 +1459,50 @@ class TUIApplication:
         curses.init_pair(4, curses.COLOR_YELLOW, -1)  # 경고
         curses.init_pair(5, curses.COLOR_CYAN, -1)  # 정보
 
+        # 색상 속성 (그릴 때마다 color_pair를 호출하지 않도록 미리 계산)
+        self.C_HEADER = curses.color_pair(1) | curses.A_BOLD
+        self.C_WARN = curses.color_pair(4)
+        self.C_INFO = curses.color_pair(5)
+
+        # 선택 메뉴의 ESC 키를 바로 인식하도록 (기본값은 1초 대기)
+        if hasattr(curses, "set_escdelay"):
+            curses.set_escdelay(25)
+
+        # 고정 문구 (매 프레임 새로 만들지 않음)
+        self._title = " MySQL 자동 테스트 데이터 생성기 (TUI) "
+        self._cmd_help = "명령: 1=프로파일 2=시나리오 3=분석 4=스키마생성 5=데이터생성 6=롤백 7=덤프 Q=종료"
+
+        # 화면 너비에 따라 달라지는 문구 (_layout에서 크기가 바뀔 때만 다시 만듦)
+        self._menu_lines: List[str] = []
+        self._divider = ""
+        self._mid_divider = ""
+
+        # 상단/중간/하단 창과 창별 마지막 출력 내용 (바뀐 줄만 다시 쓰기 위함)
+        self._size: Tuple[int, int] = (0, 0)
+        self._wins: Dict[str, Any] = {}
+        self._shadow: Dict[str, List[Optional[Tuple[int, str, int]]]] = {}
+        self._layout()
+
+        # 프레임 출력 대상 터미널 (동기화 업데이트 시퀀스를 지원할 때만 사용)
+        self._tty_fd = sys.stdout.fileno() if _sync_update_supported() else None
+
+        # 마지막 진행 상태 갱신 시각 (monotonic ns)과 그때의 테이블명
+        self._last_draw_ns = 0
+        self._last_progress_table: Optional[str] = None
+
+        # 프로파일/시나리오 목록 캐시 (디렉토리 mtime이 그대로면 다시 스캔하지 않음)
+        self._profiles_cache: Optional[Tuple[Any, List[str]]] = None
+        self._scenarios_cache: Dict[str, Tuple[int, List[Tuple[str, str]]]] = {}
+
+        # DB 작업용 백그라운드 스레드
+        # - 작업 스레드는 curses를 직접 건드리지 않고 (종류, 메시지) 이벤트만 큐에 넣음
+        self._worker = ThreadPoolExecutor(max_workers=1)
+        self._events: "queue.Queue[Tuple[str, str]]" = queue.Queue()
+        self._cancel = threading.Event()
+
     def run(self):
         curses.curs_set(0)  # 커서 숨김
         self.stdscr.nodelay(False)
-        self.stdscr.clear()
         self.state.add_log("프로그램 시작")
 
         while True:
@@ -868,108 +1526,347 @@ class TUIApplication:
             elif c in (ord('q'), ord('Q')):
                 break
 
+        self._worker.shutdown(wait=False)
+
+    # --------------------------
+    # 백그라운드 작업
+    # --------------------------
+
+    def _run_in_background(self, func: Callable[[], Any]) -> Any:
+        """
+        func를 백그라운드 스레드에서 실행하고, 끝날 때까지 진행 상태 표시와 키 입력 처리
+        - 실행 중 q 키: 취소 요청 (작업 스레드의 다음 진행 콜백에서 OperationCancelled 발생)
+        - func의 반환값을 반환하고, func에서 발생한 예외는 그대로 다시 발생
+        """
+        self._cancel.clear()
+        future = self._worker.submit(func)
+
+        self.stdscr.timeout(50)
+        try:
+            while not future.done():
+                c = self.stdscr.getch()
+                if c in (ord('q'), ord('Q')) and not self._cancel.is_set():
+                    self._cancel.set()
+                    self._events.put(("progress", "취소 요청됨... 현재 단계가 끝나면 중단합니다"))
+                elif c == curses.KEY_RESIZE:
+                    self.draw()
+                self._drain_events()
+        except BaseException:
+            # Ctrl+C 등으로 빠져나가면 취소 요청 후 작업 스레드가 끝날 때까지 대기
+            # - 호출자의 close()/종료 처리가 작업 스레드가 쓰는 연결을 건드리지 않도록
+            self._cancel.set()
+            self._wait_worker(future)
+            raise
+        finally:
+            self.stdscr.timeout(-1)
+
+        self._drain_events()
+        return future.result()
+
+    def _wait_worker(self, future):
+        """
+        취소 요청된 작업이 끝날 때까지 대기 (다음 진행 콜백까지 또는 진행 중인 SQL 문이 끝날 때까지)
+        - 대기 중 반복되는 Ctrl+C는 무시 (원래 예외는 호출자가 다시 발생)
+        """
+        self.state.progress = "취소 중... 진행 중인 DB 작업이 끝나기를 기다립니다"
+        try:
+            self._refresh_status()
+        except (curses.error, KeyboardInterrupt, SystemExit):
+            pass
+
+        while not future.done():
+            try:
+                futures_wait([future])
+            except (KeyboardInterrupt, SystemExit):
+                continue
+
+    def _drain_events(self):
+        """작업 스레드가 큐에 넣은 진행 상태/로그를 화면에 반영"""
+        redraw = status = False
+        while True:
+            try:
+                kind, message = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                self.state.progress = message
+                status = True
+            else:
+                self.state.add_log(message)
+                redraw = True
+
+        if redraw:
+            self.draw()
+        elif status:
+            self._refresh_status()
+
+    def _check_cancelled(self):
+        """작업 스레드에서 호출 - 취소 요청이 있으면 OperationCancelled 발생"""
+        if self._cancel.is_set():
+            raise OperationCancelled()
+
     # --------------------------
     # UI 그리기
     # --------------------------
 
-    def draw(self):
-        self.stdscr.clear()
+    def _layout(self):
+        """
+        화면 크기에 맞춰 상단/중간/하단 창 생성
+        - 크기가 바뀔 때만 다시 생성하고, 평소에는 같은 창에 바뀐 줄만 갱신
+        """
         height, width = self.stdscr.getmaxyx()
-
-        # 화면 분할
-        top_height = 4
-        bottom_height = 5
+        self._size = (height, width)
+
+        # 메뉴 (화면 너비를 넘으면 항목 단위로 다음 줄에 이어서 표시)
+        self._menu_lines = []
+        menu_line = ""
+        for item in MENU_ITEMS:
+            candidate = f"{menu_line} | {item}" if menu_line else item
+            if menu_line and _display_width(candidate) > width - 4:
+                self._menu_lines.append(menu_line)
+                candidate = item
+            menu_line = candidate
+        self._menu_lines.append(menu_line)
+
+        # 화면 분할 (상단: 타이틀 + 설정 정보 + 메뉴 줄 수, 메뉴가 줄바꿈되어도 잘리지 않도록)
+        top_height = min(2 + max(2, len(self._menu_lines)), height)
+        bottom_height = min(5, height - top_height)
         mid_height = height - top_height - bottom_height
 
+        self.stdscr.erase()
+        self.stdscr.noutrefresh()
+
+        # 구분선 (하단 상태바는 전체 너비, 중간 영역은 좌우 여백 제외)
+        self._divider = "═" * width
+        self._mid_divider = "═" * max(0, width - 2)
+
+        y = 0
+        for name, h in (("top", top_height), ("middle", mid_height), ("bottom", bottom_height)):
+            self._wins[name] = curses.newwin(h, width, y, 0) if h > 0 else None
+            self._shadow[name] = [None] * h
+            y += h
+
+    def _invalidate(self):
+        """선택 메뉴 등이 화면을 덮어쓴 뒤, 다음 draw에서 모든 창을 다시 그리도록 표시"""
+        for name, win in self._wins.items():
+            self._shadow[name] = [None] * len(self._shadow[name])
+            if win is not None:
+                win.erase()
+                win.touchwin()
+
+    def _render(self, name: str, lines: List[Tuple[int, str, int]]):
+        """
+        창의 각 줄을 직전 출력(shadow)과 비교해 바뀐 줄만 다시 쓰기
+        lines: (x, 문자열, 속성) 목록 - 창 높이를 넘는 줄은 무시
+        """
+        win = self._wins[name]
+        if win is None:
+            return
+
+        for row in range(len(self._shadow[name])):
+            self._put_line(name, row, lines[row] if row < len(lines) else None)
+        win.noutrefresh()
+
+    def _put_line(self, name: str, row: int, line: Optional[Tuple[int, str, int]]):
+        """창의 한 줄을 직전 출력과 비교해 바뀐 경우에만 다시 쓰기 (None이면 빈 줄)"""
+        shadow = self._shadow[name]
+        if shadow[row] == line:
+            return
+        shadow[row] = line
+
+        win = self._wins[name]
+        win.move(row, 0)
+        win.clrtoeol()
+        if line:
+            x, text, attr = line
+            self._safe_addstr(row, x, text, attr, win)
+
+    def _safe_addstr(self, y: int, x: int, text: str, attr: int = 0, win=None):
+        """
+        대상 창 범위 안일 때만 addstr (범위 밖 좌표는 호출하지 않고 건너뜀)
+        - y, x는 대상 창 기준 좌표이며 범위도 그 창의 크기(getmaxyx)로 판단
+        - 문자열은 표시 폭 기준으로 창 오른쪽 끝에서 자름 (제어 문자는 공백으로 바꿔 항상 한 줄로 출력)
+        - win: 대상 창 (기본 stdscr)
+        """
+        height, width = win.getmaxyx() if win is not None else self._size
+        if not (0 <= y < height and 0 <= x < width):
+            return
+        try:
+            (win or self.stdscr).addstr(y, x, _clip(text.translate(_CONTROL_CHARS), width - x), attr)
+        except curses.error:
+            # 창의 마지막 칸까지 쓰면 커서를 옮길 수 없어 에러가 나지만 출력은 됨
+            pass
+
+    def _flush_frame(self):
+        """
+        noutrefresh로 준비해 둔 창들을 한 번의 doupdate로 출력
+        - 동기화 업데이트 시퀀스로 감싸 터미널이 중간 상태(깜빡임/찢어짐) 없이 한 번에 표시하도록 함
+          (시퀀스를 쓸 수 없는 터미널에서는 doupdate만 호출)
+        """
+        if self._tty_fd is None:
+            curses.doupdate()
+            return
+        os.write(self._tty_fd, SYNC_UPDATE_BEGIN)
+        curses.doupdate()
+        os.write(self._tty_fd, SYNC_UPDATE_END)
+
+    def draw(self):
+        if self.stdscr.getmaxyx() != self._size:
+            self._layout()
+
+        height, width = self._size
+
         # 상단 헤더
-        self.draw_top(0, 0, top_height, width)
+        self.draw_top(len(self._shadow["top"]), width)
         # 중간 컨텐츠
-        self.draw_middle(top_height, 0, mid_height, width)
+        self.draw_middle(len(self._shadow["middle"]), width)
         # 하단 상태바
-        self.draw_bottom(top_height + mid_height, 0, bottom_height, width)
+        self.draw_bottom(len(self._shadow["bottom"]), width)
 
-        self.stdscr.refresh()
+        self._flush_frame()
 
-    def draw_top(self, y, x, h, w):
+    def _refresh_status(self):
+        """진행 상태 갱신 - 하단 상태바만 다시 그림"""
+        if self.stdscr.getmaxyx() != self._size:
+            self.draw()
+            return
+
+        self.draw_bottom(len(self._shadow["bottom"]), self._size[1])
+        self._flush_frame()
+
+    def _progress_due(self, table_name: str, current: int, total: int) -> bool:
+        """
+        진행 상태를 지금 다시 그릴지 여부
+        - 직전 갱신 후 PROGRESS_REFRESH_INTERVAL_NS가 지나지 않았으면 건너뜀
+        - 처리 테이블이 바뀐 첫 틱과 전체 완료 시점(current == total)은 항상 갱신
+        """
+        now = time.monotonic_ns()
+        if (now - self._last_draw_ns < PROGRESS_REFRESH_INTERVAL_NS
+                and table_name == self._last_progress_table and current != total):
+            return False
+        self._last_draw_ns = now
+        self._last_progress_table = table_name
+        return True
+
+    def draw_top(self, h, w):
         """상단 헤더 - 타이틀 및 메뉴"""
+        lines = []
+
         # 타이틀
-        title = " MySQL 자동 테스트 데이터 생성기 (TUI) "
-        try:
-            self.stdscr.addstr(y, max(0, (w - len(title)) // 2), title, curses.color_pair(1) | curses.A_BOLD)
-        except:
-            pass
-        
+        title = self._title
+        lines.append((max(0, (w - _display_width(title)) // 2), title, self.C_HEADER))
+
         # 현재 설정 정보
-        info_line = f"Profile: {self.state.current_profile or 'None'} | Scenario: {self.state.current_scenario or 'None'}"
-        try:
-            self.stdscr.addstr(y + 1, 2, info_line, curses.color_pair(5))
-        except:
-            pass
-        
+        lines.append((2, self.state.info_line, self.C_INFO))
+
         # 메뉴
-        menu_line = " | ".join(MENU_ITEMS)
-        try:
-            self.stdscr.addstr(y + 2, 2, menu_line)
-        except:
-            pass
+        for menu_line in self._menu_lines:
+            lines.append((2, menu_line, 0))
 
-    def draw_middle(self, y, x, h, w):
-        """중간 컨텐츠 영역"""
-        lines = []
+        self._render("top", lines)
+
+    def draw_middle(self, h, w):
+        """중간 컨텐츠 영역 - 줄 목록을 만들지 않고 위에서부터 바로 출력"""
+        win = self._wins["middle"]
+        if win is None:
+            return
+
+        limit = h - 1  # 마지막 줄은 비워 둠
+        row = 0
+
+        def put(x, text):
+            nonlocal row
+            if row < limit:
+                self._put_line("middle", row, (x, text, 0))
+                row += 1
         
         # 현재 상태 정보
-        lines.append("═" * (w - 2))
-        lines.append("[ 현재 상태 ]")
-        lines.append(f"  프로파일: {self.state.current_profile or '선택 안됨 (메뉴 1)'}")
-        lines.append(f"  시나리오: {self.state.current_scenario or '선택 안됨 (메뉴 2)'}")
+        put(1, self._mid_divider)
+        put(1, "[ 현재 상태 ]")
+        put(1, f"  프로파일: {self.state.current_profile or '선택 안됨 (메뉴 1)'}")
+        put(1, f"  시나리오: {self.state.current_scenario or '선택 안됨 (메뉴 2)'}")
         
         if self.state.schema:
-            lines.append(f"  스키마 테이블: {len(self.state.schema.tables)}개")
+            put(1, f"  스키마 테이블: {len(self.state.schema.tables)}개")
         if self.state.scenario:
-            lines.append(f"  시나리오 테이블: {len(self.state.scenario.tables)}개")
+            put(1, f"  시나리오 테이블: {len(self.state.scenario.tables)}개")
         
-        lines.append("")
-        lines.append("[ 최근 메시지 ]")
+        put(1, "")
+        put(1, "[ 최근 메시지 ]")
         if self.state.last_message:
-            lines.append(f"  {self.state.last_message}")
+            # 여러 줄 메시지(mysqldump stderr 등)는 줄마다 한 행
+            for text in self.state.last_message.splitlines():
+                put(3, text)
         
-        lines.append("")
-        lines.append("[ 로그 ]")
-        
-        # 로그 메시지 표시 (최신 것부터)
-        log_start_line = len(lines)
-        remaining_lines = h - log_start_line - 1
+        put(1, "")
+        put(1, "[ 로그 ]")
         
+        # 로그 메시지 표시 (남은 줄 수만큼 최신 로그, 들여쓰기는 x 위치로 처리)
+        # - 여러 줄 로그는 줄마다 한 행, 두 번째 줄부터는 타임스탬프 없이 메시지 위치에 맞춰 표시
+        remaining_lines = limit - row
         if remaining_lines > 0:
-            recent_logs = self.state.log_messages[-remaining_lines:]
-            for log in recent_logs:
-                lines.append(f"  {log}")
-        
-        # 화면에 출력
-        for idx, line in enumerate(lines):
-            if idx >= h - 1:
-                break
-            try:
-                display_line = line[:w-2]  # 화면 너비에 맞춤
-                self.stdscr.addstr(y + idx, x + 1, display_line)
-            except:
-                pass
-
-    def draw_bottom(self, y, x, h, w):
+            tail: List[Tuple[int, str]] = []
+            for log in reversed(self.state.log_messages):
+                if "\n" in log:
+                    first, *rest = log.split("\n")
+                    tail.extend((3 + LOG_TIMESTAMP_WIDTH, text) for text in reversed(rest))
+                    tail.append((3, first))
+                else:
+                    tail.append((3, log))
+                if len(tail) >= remaining_lines:
+                    break
+            for x, text in reversed(tail[:remaining_lines]):
+                put(x, text)
+
+        # 이전 프레임보다 줄이 줄었으면 나머지 줄 지우기
+        for r in range(row, h):
+            self._put_line("middle", r, None)
+        win.noutrefresh()
+
+    def draw_bottom(self, h, w):
         """하단 상태바"""
+        self._render("bottom", [
+            (0, self._divider, 0),  # 구분선
+            (1, self.state.progress_line, 0),  # 진행 상태
+            (1, self._cmd_help, self.C_WARN),  # 명령어 안내
+        ])
+
+    # --------------------------
+    # 프로파일/시나리오 목록
+    # --------------------------
+
+    def _list_profiles(self) -> List[str]:
+        """
+        get_available_profiles() 결과를 디렉토리 mtime 기준으로 캐시
+        - config 디렉토리 mtime: 프로파일 디렉토리 추가/삭제
+        - 각 프로파일 디렉토리 mtime: connection.json/schema.sql 추가/삭제
+        """
+        if not os.path.isdir(CONFIG_DIR):
+            return []
+
+        with os.scandir(CONFIG_DIR) as entries:
+            key = (
+                os.stat(CONFIG_DIR).st_mtime_ns,
+                frozenset((e.name, e.stat().st_mtime_ns) for e in entries if e.is_dir()),
+            )
+        if self._profiles_cache is None or self._profiles_cache[0] != key:
+            self._profiles_cache = (key, get_available_profiles())
+        return self._profiles_cache[1]
+
+    def _list_scenarios(self, profile: str) -> List[Tuple[str, str]]:
+        """get_available_scenarios() 결과를 프로파일 시나리오 디렉토리 mtime 기준으로 캐시"""
+        scenario_path = os.path.join(SCENARIO_DIR, profile)
         try:
-            # 구분선
-            self.stdscr.addstr(y, 0, "═" * w)
-            
-            # 진행 상태
-            progress = self.state.progress or "대기 중..."
-            self.stdscr.addstr(y + 1, 1, f"[진행] {progress}"[:w-2])
-            
-            # 명령어 안내
-            cmd_help = "명령: 1=프로파일 2=시나리오 3=분석 4=스키마생성 5=데이터생성 6=롤백 7=덤프 Q=종료"
-            self.stdscr.addstr(y + 2, 1, cmd_help[:w-2], curses.color_pair(4))
-        except:
-            pass
+            mtime = os.stat(scenario_path).st_mtime_ns
+        except FileNotFoundError:
+            self._scenarios_cache.pop(profile, None)
+            return []
+
+        cached = self._scenarios_cache.get(profile)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, get_available_scenarios(profile))
+            self._scenarios_cache[profile] = cached
+        return cached[1]
 
     # --------------------------
     # 메뉴 핸들러
@@ -978,7 +1875,7 @@ class TUIApplication:
     def handle_select_profile(self):
         """프로파일 선택"""
         self.state.current_menu = 1
-        profiles = get_available_profiles()
+        profiles = self._list_profiles()
         
         if not profiles:
             self.state.last_message = "사용 가능한 프로파일이 없습니다. config/ 폴더를 확인하세요."
@@ -989,6 +1886,7 @@ class TUIApplication:
         if selected_idx is not None:
             selected_profile = profiles[selected_idx]
             self.state.current_profile = selected_profile
+            self.state.schema_file = os.path.join(CONFIG_DIR, selected_profile, "schema.sql")
             self.state.last_message = f"프로파일 '{selected_profile}' 선택됨"
             self.state.add_log(f"프로파일 선택: {selected_profile}")
             
@@ -1009,7 +1907,7 @@ class TUIApplication:
             self.state.add_log("프로파일 미선택 경고")
             return
         
-        scenarios = get_available_scenarios(self.state.current_profile)
+        scenarios = self._list_scenarios(self.state.current_profile)
         
         if not scenarios:
             self.state.last_message = f"'{self.state.current_profile}' 프로파일의 시나리오가 없습니다."
@@ -1046,45 +1944,54 @@ class TUIApplication:
         self.state.progress = "스키마 생성 중..."
         self.state.add_log("스키마 생성 시작")
         self.draw()
-        self.stdscr.refresh()
         
-        schema_file = os.path.join(CONFIG_DIR, self.state.current_profile, "schema.sql")
-        creator = SchemaCreator(schema_file, self.state.db_config)
+        creator = SchemaCreator(self.state.schema_file, self.state.db_config)
         
+        # 작업 스레드에서 실행됨
         def progress_callback(table_name, current, total):
-            self.state.progress = f"테이블 '{table_name}' 생성 중... ({current}/{total})"
-            self.draw()
-            self.stdscr.refresh()
+            self._check_cancelled()
+            if not self._progress_due(table_name, current, total):
+                return
+            self._events.put(("progress", f"테이블 '{table_name}' 생성 중... ({current}/{total})"))
+
+        def work():
+            creator.connect()
+            self._events.put(("log", "DB 연결 성공"))
+            return creator.create_missing_tables(progress_callback)
         
         try:
-            creator.connect()
-            self.state.add_log("DB 연결 성공")
-            results = creator.create_missing_tables(progress_callback)
+            results = self._run_in_background(work)
             
-            # 결과 집계
-            created = sum(1 for v in results.values() if v == "created")
-            exists = sum(1 for v in results.values() if v == "already_exists")
-            errors = sum(1 for v in results.values() if v.startswith("error"))
-            
-            self.state.last_message = f"스키마 생성 완료: 생성 {created}개, 기존 {exists}개, 오류 {errors}개"
-            self.state.add_log(f"생성 완료: {created}개 테이블 생성됨")
-            
-            # 상세 로그
+            # 결과 집계 및 상세 로그 (한 번 순회)
+            counts: Counter = Counter()
+            details = []
             for table, result in results.items():
                 if result == "created":
-                    self.state.add_log(f"  ✓ {table}: 생성됨")
+                    counts["created"] += 1
+                    details.append(f"  ✓ {table}: 생성됨")
                 elif result == "already_exists":
-                    self.state.add_log(f"  - {table}: 이미 존재")
+                    counts["exists"] += 1
+                    details.append(f"  - {table}: 이미 존재")
                 else:
-                    self.state.add_log(f"  ✗ {table}: {result}")
+                    counts["error"] += 1
+                    details.append(f"  ✗ {table}: {result}")
+            
+            self.state.last_message = (
+                f"스키마 생성 완료: 생성 {counts['created']}개, 기존 {counts['exists']}개, 오류 {counts['error']}개"
+            )
+            self.state.add_log(f"생성 완료: {counts['created']}개 테이블 생성됨")
+            for line in details:
+                self.state.add_log(line)
                     
+        except OperationCancelled as e:
+            self.state.last_message = f"스키마 생성 취소: {e}"
+            self.state.add_log("스키마 생성 취소됨")
         except Exception as e:
             self.state.last_message = f"스키마 생성 실패: {e}"
             self.state.add_log(f"오류: {e}")
         finally:
             creator.close()
             self.state.progress = ""
-            self.draw()
 
     def handle_analyze(self):
         """스키마/시나리오 분석"""
@@ -1103,13 +2010,10 @@ class TUIApplication:
         self.state.progress = "스키마/시나리오 분석 중..."
         self.state.add_log("분석 시작")
         self.draw()
-        self.stdscr.refresh()
 
         try:
             # 스키마 파싱
-            schema_file = os.path.join(CONFIG_DIR, self.state.current_profile, "schema.sql")
-            parser = MySQLSchemaParser(schema_file)
-            schema = parser.parse()
+            schema, _ = load_schema(self.state.schema_file)
 
             # 시나리오 로드
             loader = ScenarioLoader(self.state.current_scenario)
@@ -1125,7 +2029,6 @@ class TUIApplication:
             self.state.add_log(f"오류: {e}")
 
         self.state.progress = ""
-        self.draw()
 
     def handle_generate(self):
         """테스트 데이터 생성"""
@@ -1134,19 +2037,16 @@ class TUIApplication:
         if not self.state.schema or not self.state.scenario:
             self.state.last_message = "먼저 스키마/시나리오 분석을 수행하세요 (메뉴 3)"
             self.state.add_log("분석 필요 경고")
-            self.draw()
             return
         
         if not self.state.db_config:
             self.state.last_message = "DB 연결 설정이 없습니다"
             self.state.add_log("DB 설정 오류")
-            self.draw()
             return
 
         self.state.progress = "테스트 데이터 생성 중..."
         self.state.add_log("데이터 생성 시작")
         self.draw()
-        self.stdscr.refresh()
 
         scenario_name = os.path.basename(self.state.current_scenario) if self.state.current_scenario else "unknown"
         gen = TestDataGenerator(
@@ -1157,29 +2057,38 @@ class TUIApplication:
             scenario_name
         )
         
+        # 작업 스레드에서 실행됨
         def progress_callback(table_name, current, total):
+            self._check_cancelled()
+            if not self._progress_due(table_name, current, total):
+                return
             percent = int((current / total) * 100)
-            self.state.progress = f"테이블 '{table_name}' 처리 중... ({current}/{total}, {percent}%)"
-            self.draw()
-            self.stdscr.refresh()
+            self._events.put(("progress", f"테이블 '{table_name}' 처리 중... ({current}/{total}, {percent}%)"))
+
+        def work():
+            gen.connect()
+            self._events.put(("log", "DB 연결 성공"))
+            return gen.generate_and_insert(progress_callback)
         
         try:
-            gen.connect()
-            self.state.add_log("DB 연결 성공")
-            run_log = gen.generate_and_insert(progress_callback)
+            run_log = self._run_in_background(work)
             self.state.last_message = f"데이터 생성 완료! run_id={run_log.run_id}"
             self.state.add_log(f"생성 완료: run_id={run_log.run_id}")
             
-            # 생성된 레코드 수 로그
-            for table, pks in run_log.inserted_rows.items():
-                self.state.add_log(f"  {table}: {len(pks)}개 레코드")
+            # 생성된 레코드 수 로그 (테이블별로 나누지 않고 한 항목으로 남겨 이전 로그가 밀려나지 않게)
+            if run_log.inserted_rows:
+                summary = "\n".join(f"  {table}: {len(pks)}개 레코드" for table, pks in run_log.inserted_rows.items())
+                self.state.add_log(f"레코드 요약:\n{summary}")
+        except OperationCancelled as e:
+            # 생성 중 취소되면 트랜잭션이 롤백되어 삽입된 데이터는 남지 않음
+            self.state.last_message = f"데이터 생성 취소: {e}"
+            self.state.add_log("데이터 생성 취소됨 (롤백 완료)")
         except Exception as e:
             self.state.last_message = f"데이터 생성 실패: {e}"
             self.state.add_log(f"오류: {e}")
         finally:
             gen.close()
             self.state.progress = ""
-            self.draw()
 
     def handle_rollback(self):
         """데이터 롤백"""
@@ -1187,60 +2096,46 @@ class TUIApplication:
         self.state.progress = "롤백할 run 목록 조회 중..."
         self.state.add_log("롤백 목록 조회")
         self.draw()
-        self.stdscr.refresh()
 
-        # 스키마가 없으면 로드
-        if not self.state.schema:
-            if not self.state.current_profile:
-                self.state.last_message = "프로파일을 선택하거나 스키마를 분석하세요"
-                self.state.progress = ""
-                self.draw()
-                return
-            
-            try:
-                schema_file = os.path.join(CONFIG_DIR, self.state.current_profile, "schema.sql")
-                parser = MySQLSchemaParser(schema_file)
-                self.state.schema = parser.parse()
-            except Exception as e:
-                self.state.last_message = f"스키마 파싱 실패: {e}"
-                self.state.add_log(f"오류: {e}")
-                self.state.progress = ""
-                self.draw()
-                return
+        # 현재 프로파일의 스키마 (schema.sql이 바뀌지 않았으면 캐시된 파싱 결과 재사용)
+        # - 분석 후 프로파일을 바꾸거나 schema.sql을 수정해도 이전 스키마로 롤백하지 않도록 매번 조회
+        if not self.state.current_profile:
+            self.state.last_message = "먼저 프로파일을 선택하세요 (메뉴 1)"
+            self.state.progress = ""
+            return
+
+        try:
+            schema, _ = load_schema(self.state.schema_file)
+        except Exception as e:
+            self.state.last_message = f"스키마 파싱 실패: {e}"
+            self.state.add_log(f"오류: {e}")
+            self.state.progress = ""
+            return
 
         if not self.state.db_config:
-            if self.state.current_profile:
-                try:
-                    self.state.db_config = load_connection_config(self.state.current_profile)
-                except Exception as e:
-                    self.state.last_message = f"DB 설정 로드 실패: {e}"
-                    self.state.progress = ""
-                    self.draw()
-                    return
-            else:
-                self.state.last_message = "DB 연결 설정이 없습니다"
+            try:
+                self.state.db_config = load_connection_config(self.state.current_profile)
+            except Exception as e:
+                self.state.last_message = f"DB 설정 로드 실패: {e}"
                 self.state.progress = ""
-                self.draw()
                 return
 
-        manager = RollbackManager(self.state.schema, self.state.db_config)
+        manager = RollbackManager(schema, self.state.db_config)
         runs = manager.list_runs()
         self.state.progress = ""
 
         if not runs:
             self.state.last_message = "롤백 가능한 run 로그가 없습니다"
             self.state.add_log("롤백 가능한 로그 없음")
-            self.draw()
             return
 
-        # run 선택
-        run_displays = [f"{r['run_id']} [{r['profile']}/{r['scenario']}] {r['created_at']}" for r in runs]
+        # run 선택 (표시 문자열은 메뉴에 보이는 항목만 생성)
+        run_displays = _LazyFormatList(runs, lambda r: f"{r['run_id']} [{r['profile']}/{r['scenario']}] {r['created_at']}")
         selected_idx = self._show_selection_menu("롤백할 실행 선택", run_displays)
         
         if selected_idx is None:
             self.state.last_message = "롤백 취소"
             self.state.add_log("롤백 취소됨")
-            self.draw()
             return
 
         selected_run = runs[selected_idx]
@@ -1250,13 +2145,11 @@ class TUIApplication:
         self.state.progress = f"run_id={selected_run_id} 롤백 중..."
         self.state.add_log(f"롤백 시작: {selected_run_id}")
         self.draw()
-        self.stdscr.refresh()
 
         msg = manager.rollback_run(selected_run_id, selected_file_path)
         self.state.last_message = msg
         self.state.add_log(msg)
         self.state.progress = ""
-        self.draw()
 
     def handle_dump(self):
         """MySQL 덤프"""
@@ -1274,71 +2167,101 @@ class TUIApplication:
                 self.state.add_log("DB 설정 없음")
                 return
         
+        # 저장 형식 선택
+        selected_idx = self._show_selection_menu("덤프 형식 선택", ["SQL (.sql)", "gzip 압축 (.sql.gz)"])
+        if selected_idx is None:
+            self.state.last_message = "덤프 취소"
+            self.state.add_log("덤프 취소됨")
+            return
+        compress = selected_idx == 1
+
         self.state.progress = "mysqldump 실행 중..."
-        self.state.add_log("덤프 시작")
+        self.state.add_log("덤프 시작 (gzip 압축)" if compress else "덤프 시작")
         self.draw()
-        self.stdscr.refresh()
 
         dump_mgr = MySQLDumpManager(self.state.db_config)
         ts = datetime.now().strftime("%Y%m%d%H%M%S")
         output_file = f"dump_{self.state.db_config['database']}_{ts}.sql"
 
-        msg = dump_mgr.dump(output_file)
+        msg = dump_mgr.dump(output_file, compress=compress)
         self.state.last_message = msg
         self.state.add_log(msg)
         self.state.progress = ""
-        self.draw()
     
-    def _show_selection_menu(self, title: str, items: List[str]) -> Optional[int]:
+    def _show_selection_menu(self, title: str, items: Sequence) -> Optional[int]:
         """
         선택 메뉴 표시
+        - ↑/↓: 이동, Enter: 선택, 숫자 키(1~9): 해당 번호로 이동, ESC/0/Q: 취소
+        - 이동 시 이전/새 선택 줄 두 줄만 다시 그림 (목록이 스크롤될 때만 전체를 다시 그림)
         반환: 선택된 인덱스 (None이면 취소)
         """
-        self.stdscr.clear()
-        height, width = self.stdscr.getmaxyx()
-        
-        try:
-            self.stdscr.addstr(0, 2, title, curses.A_BOLD)
-            self.stdscr.addstr(1, 2, "=" * min(len(title), width - 4))
-        except:
-            pass
-        
-        # 항목 표시
-        for idx, item in enumerate(items[:height - 5], start=1):
-            try:
-                display = f"{idx}. {item}"[:width - 4]
-                self.stdscr.addstr(idx + 2, 2, display)
-            except:
-                pass
-        
-        # 입력 프롬프트
-        prompt_y = min(len(items) + 4, height - 2)
-        try:
-            self.stdscr.addstr(prompt_y, 2, "선택 (0=취소): ")
-        except:
-            pass
-        
-        curses.echo()
-        curses.curs_set(1)
-        
-        try:
-            choice = self.stdscr.getstr(prompt_y, 18, 10)
-            choice_str = choice.decode("utf-8").strip()
-        except:
-            choice_str = "0"
-        finally:
-            curses.noecho()
-            curses.curs_set(0)
-        
-        try:
-            num = int(choice_str)
-        except:
+        if not items:
             return None
-        
-        if num <= 0 or num > len(items):
-            return None
-        
-        return num - 1
+
+        selected = 0
+        top = 0  # 화면 첫 줄에 보이는 항목 인덱스
+        visible = 1
+
+        def draw_item(i):
+            attr = curses.A_REVERSE if i == selected else 0
+            self._safe_addstr(3 + i - top, 2, f"{i + 1}. {items[i]}", attr)
+
+        def draw_menu():
+            nonlocal top, visible
+            if self.stdscr.getmaxyx() != self._size:
+                self._layout()
+            # 메뉴가 화면 전체를 덮으므로 이후 draw에서 모든 창을 다시 그림
+            self._invalidate()
+            self.stdscr.erase()
+            height, width = self._size
+
+            # 선택 항목이 보이도록 스크롤 위치 조정
+            visible = max(1, height - 5)
+            if selected < top:
+                top = selected
+            elif selected >= top + visible:
+                top = selected - visible + 1
+
+            self._safe_addstr(0, 2, title, curses.A_BOLD)
+            self._safe_addstr(1, 2, "=" * min(len(title), width - 4))
+            for i in range(top, min(len(items), top + visible)):
+                draw_item(i)
+
+            # 조작 안내
+            hint_y = min(3 + min(len(items), visible) + 1, height - 1)
+            self._safe_addstr(hint_y, 2, "↑/↓: 이동  Enter: 선택  ESC: 취소", self.C_WARN)
+
+            self.stdscr.noutrefresh()
+            self._flush_frame()
+
+        draw_menu()
+        while True:
+            c = self.stdscr.getch()
+            prev = selected
+
+            if c == curses.KEY_UP:
+                selected = max(0, selected - 1)
+            elif c == curses.KEY_DOWN:
+                selected = min(len(items) - 1, selected + 1)
+            elif ord('1') <= c <= ord('9') and c - ord('1') < len(items):
+                selected = c - ord('1')
+            elif c in (curses.KEY_ENTER, 10, 13):
+                return selected
+            elif c in (27, ord('0'), ord('q'), ord('Q')):
+                return None
+            elif c == curses.KEY_RESIZE:
+                draw_menu()
+                continue
+
+            if selected == prev:
+                continue
+            if top <= selected < top + visible:
+                draw_item(prev)
+                draw_item(selected)
+                self.stdscr.noutrefresh()
+                self._flush_frame()
+            else:
+                draw_menu()
 
 
 # ==========================
@@ -1348,8 +2271,9 @@ class TUIApplication:
 def main():
     """메인 함수"""
     # SIGINT 처리 (Ctrl+C)
+    # - 풀 종료/락 해제는 여기서 하지 않고 main의 finally에서 수행
+    #   (백그라운드 DB 작업이 끝나기 전에 연결을 닫거나 락을 풀지 않도록)
     def signal_handler(sig, frame):
-        release_lock()
         sys.exit(0)
 
     signal.signal(signal.SIGINT, signal_handler)
@@ -1360,31 +2284,39 @@ def main():
     except SystemExit:
         return
 
-    # 설정 디렉토리 확인
-    if not os.path.exists(CONFIG_DIR):
-        print(f"설정 디렉토리가 없습니다: {CONFIG_DIR}")
-        print(f"다음 구조로 설정 파일을 생성하세요:")
-        print(f"  {CONFIG_DIR}/[profile]/connection.json")
-        print(f"  {CONFIG_DIR}/[profile]/schema.sql")
-        print(f"  {SCENARIO_DIR}/[profile]/[scenario].json")
-        release_lock()
-        return
+    # 락 해제/풀 종료는 어떤 경로로 끝나든 finally에서 한 번만
+    try:
+        # 설정 디렉토리 확인
+        if not os.path.exists(CONFIG_DIR):
+            print(f"설정 디렉토리가 없습니다: {CONFIG_DIR}")
+            print(f"다음 구조로 설정 파일을 생성하세요:")
+            print(f"  {CONFIG_DIR}/[profile]/connection.json")
+            print(f"  {CONFIG_DIR}/[profile]/schema.sql")
+            print(f"  {SCENARIO_DIR}/[profile]/[scenario].json")
+            return
     
-    if not os.path.exists(SCENARIO_DIR):
-        print(f"시나리오 디렉토리가 없습니다: {SCENARIO_DIR}")
-        os.makedirs(SCENARIO_DIR, exist_ok=True)
-        print(f"디렉토리를 생성했습니다: {SCENARIO_DIR}")
+        if not os.path.exists(SCENARIO_DIR):
+            print(f"시나리오 디렉토리가 없습니다: {SCENARIO_DIR}")
+            os.makedirs(SCENARIO_DIR, exist_ok=True)
+            print(f"디렉토리를 생성했습니다: {SCENARIO_DIR}")
 
-    try:
-        curses.wrapper(lambda stdscr: TUIApplication(stdscr).run())
-    except KeyboardInterrupt:
-        pass
-    except Exception as e:
-        print(f"프로그램 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        # 표준 출력을 줄 단위가 아닌 블록 단위(8KiB 버퍼)로 모아서 출력
+        # - 터미널 모드가 바뀌는 종료/오류 경로에서 반쯤 쓰인 출력이 섞이지 않도록 flush는 finally에서 한 번에
+        sys.stdout.reconfigure(line_buffering=False)
+
+        try:
+            curses.wrapper(lambda stdscr: TUIApplication(stdscr).run())
+        except KeyboardInterrupt:
+            pass
+        except Exception as e:
+            print(f"프로그램 오류: {e}")
+            sys.stdout.flush()  # stderr로 나가는 traceback보다 먼저 표시
+            import traceback
+            traceback.print_exc()
     finally:
+        ConnectionPool.close_all()
         release_lock()
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
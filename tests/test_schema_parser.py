@@ -0,0 +1,54 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+
+try:
+    import mysql.connector  # noqa: F401
+    HAVE_MYSQL = True
+except ImportError:
+    HAVE_MYSQL = False
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "mysql-test-data-provisioner.py")
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("provisioner", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@unittest.skipUnless(HAVE_MYSQL, "mysql-connector-python 필요")
+class SchemaParserTest(unittest.TestCase):
+    def parse(self, sql):
+        fd, path = tempfile.mkstemp(suffix=".sql")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(sql)
+        self.addCleanup(os.remove, path)
+        parser = load_module().MySQLSchemaParser(path)
+        return parser.parse(), parser.get_create_statements()
+
+    def test_semicolon_inside_comment_does_not_end_block(self):
+        sql = (
+            "CREATE TABLE `a` (\n"
+            "  `id` int NOT NULL,\n"
+            "  `x` varchar(10) COMMENT 'semi;colon',\n"
+            "  PRIMARY KEY (`id`)\n"
+            ");\n"
+            "CREATE TABLE `b` (\n"
+            "  `id` int NOT NULL,\n"
+            "  PRIMARY KEY (`id`)\n"
+            ");\n"
+        )
+        schema, statements = self.parse(sql)
+
+        self.assertEqual(schema.tables["a"].primary_key, "id")
+        self.assertEqual([c.name for c in schema.tables["a"].columns], ["id", "x"])
+        self.assertEqual(len(statements), 2)
+        self.assertTrue(statements[0].rstrip().endswith(");"))
+        self.assertIn("'semi;colon'", statements[0])
+
+
+if __name__ == "__main__":
+    unittest.main()